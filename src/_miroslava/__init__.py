@@ -1,5 +1,37 @@
 """Miroslava: A simple sandbox environment."""
 
-from .utils import *
+import sys
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import List
 
-__all__ = utils.__all__  # type: ignore[name-defined]
+from . import utils
+from .utils import __all__
+
+if TYPE_CHECKING:
+    from .utils import *
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the names from :py:mod:`_miroslava.utils` on access."""
+
+    try:
+        return getattr(utils, name)
+    except AttributeError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+
+def __dir__() -> List[str]:
+    """Return the package attributes along with the utility names."""
+
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # NOTE: Module level ``__getattr__`` (PEP 562) is supported only on
+    # Python 3.7 and above, older interpreters import the names eagerly.
+    from .utils import *
+    from .utils import stderr
+    from .utils import stdout
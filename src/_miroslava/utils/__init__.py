@@ -1,9 +1,59 @@
-from .common import *
-from .exceptions import *
-from .logging import *
-
-__all__ = (
-    common.__all__  # type: ignore[name-defined]
-    + exceptions.__all__  # type: ignore[name-defined]
-    + logging.__all__  # type: ignore[name-defined]
-)
+import importlib
+import sys
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import List
+
+if TYPE_CHECKING:
+    from .common import *
+    from .exceptions import *
+    from .logging import *
+
+# NOTE: The names are imported lazily on first access (PEP 562) so that
+# importing a sibling module, say ``common``, does not pull in the
+# logging machinery as well.
+_lazy = {
+    "SingletonMeta": "common",
+    "TTYPalette": "common",
+    "MiroslavaError": "exceptions",
+    "FileHandler": "logging",
+    "Formatter": "logging",
+    "Handler": "logging",
+    "Logger": "logging",
+    "RotatingFileHandler": "logging",
+    "StreamHandler": "logging",
+    "StreamHandlerHinter": "logging",
+    "TimedRotatingFileHandler": "logging",
+    "create_logger": "logging",
+    "get_logger": "logging",
+    "stderr": "logging",
+    "stdout": "logging",
+}
+
+# NOTE: The ``stderr`` and ``stdout`` handlers stay importable but out of
+# ``__all__``, like in ``logging``, so star imports do not create them.
+__all__ = [name for name in _lazy if name not in ("stderr", "stdout")]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the name from its submodule when first accessed."""
+
+    if name not in _lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_lazy[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Return the loaded submodules along with the lazy names."""
+
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # NOTE: Module level ``__getattr__`` (PEP 562) is supported only on
+    # Python 3.7 and above, older interpreters import the names eagerly.
+    for _name in _lazy:
+        __getattr__(_name)
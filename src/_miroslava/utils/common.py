@@ -1,14 +1,53 @@
 """Common: Collection of commonly used tools and attributes."""
 
+import functools
 import os
+import sys
 from threading import Lock
 from typing import Any
-from typing import Dict
-
-from _miroslava import palette
+from typing import List
+from typing import Tuple
 
 __all__ = ["SingletonMeta", "TTYPalette"]
 
+_ansi_enabled = False
+
+
+def _ensure_ansi() -> None:
+    """Enable ANSI escape sequences on the Windows TTY.
+
+    This runs only once, when the first record is logged to a TTY or the
+    first color is resolved from the :py:class:`TTYPalette` while the
+    standard output is a TTY, rather than on import. See how ANSI escapes work on
+    `Windows TTY`_ shell.
+
+    .. _Windows TTY: https://stackoverflow.com/a/64222858/14316408
+
+    """
+
+    global _ansi_enabled
+    if not _ansi_enabled:
+        if os.name == "nt":
+            os.system("color")
+        _ansi_enabled = True
+
+
+@functools.lru_cache(maxsize=None)
+def _tty_colors() -> Tuple[str, ...]:
+    """Return names of all the colors and styles in the palette.
+
+    The palette is scanned only once, the names are cached thereafter.
+
+    """
+
+    from _miroslava import palette
+
+    return tuple(
+        name[10:]
+        for name in vars(palette)
+        if name.startswith(("TTY_COLOR_", "TTY_STYLE_"))
+    )
+
 
 class SingletonMeta(type):
     """Thread-safe implementation of singleton design pattern.
@@ -28,35 +67,67 @@ class SingletonMeta(type):
 
     """
 
-    instances: Dict["SingletonMeta", type] = {}
     lock = Lock()
 
     def __call__(cls, *args: Any, **kwargs: Any) -> type:
-        """Callable singleton instance."""
+        """Callable singleton instance.
+
+        The instance is stored on the class itself and looked up without
+        the lock first, the lock is only acquired when the instance is
+        yet to be created.
+
+        """
+        instance = cls.__dict__.get("__singleton_instance__")
+        if instance is not None:
+            return instance  # type: ignore[no-any-return]
         with cls.lock:
-            if cls not in cls.instances:
-                cls.instances[cls] = super().__call__(*args, **kwargs)
-        return cls.instances[cls]
+            instance = cls.__dict__.get("__singleton_instance__")
+            if instance is None:
+                instance = super().__call__(*args, **kwargs)
+                type.__setattr__(cls, "__singleton_instance__", instance)
+        return instance  # type: ignore[no-any-return]
 
 
-class TTYPalette(object):
-    """Color palette for TTY.
+class _TTYPaletteMeta(type):
+    """Metaclass which resolves the :py:class:`TTYPalette` colors lazily.
 
-    This provides more than **200** unique color options to use on a
-    TTY interface. See how ANSI escapes work on `Windows TTY`_ shell.
+    The colors are looked up from the :py:mod:`_miroslava.palette`
+    module on first access and then cached on the class, so importing
+    Miroslava does not pay for scanning the complete palette.
 
-    .. _Windows TTY: https://stackoverflow.com/a/64222858/14316408
+    .. versionadded:: 1.1.0
 
     """
 
-    colors = (
-        color
-        for color in dir(palette)
-        if color.isupper() and color.startswith("TTY")
-    )
+    def __getattr__(cls, name: str) -> str:
+        """Return the color code for the requested color name."""
+
+        from _miroslava import palette
+
+        for prefix in ("TTY_COLOR_", "TTY_STYLE_"):
+            if hasattr(palette, prefix + name):
+                try:
+                    if sys.stdout.isatty():
+                        _ensure_ansi()
+                except (AttributeError, ValueError):
+                    pass
+                color = getattr(palette, prefix + name)
+                setattr(cls, name, color)
+                return color  # type: ignore[no-any-return]
+        raise AttributeError(
+            f"type object {cls.__name__!r} has no attribute {name!r}"
+        )
 
-    if os.name == "nt":
-        os.system("color")
-    for color in colors:
-        locals()[color[10:]] = getattr(palette, color)
-    del color
+    def __dir__(cls) -> List[str]:
+        """Return the class attributes along with all the color names."""
+
+        return sorted(set(_tty_colors()).union(super().__dir__()))
+
+
+class TTYPalette(metaclass=_TTYPaletteMeta):
+    """Color palette for TTY.
+
+    This provides more than **200** unique color options to use on a
+    TTY interface. The colors are resolved lazily on first access.
+
+    """
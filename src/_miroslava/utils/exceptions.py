@@ -1,6 +1,7 @@
 """Exceptions: Collection of all the exceptions raised by Miroslava."""
 
-import os
+import functools
+import shutil
 import sys
 import textwrap
 from typing import Any
@@ -8,6 +9,29 @@ from typing import Any
 __all__ = ["MiroslavaError"]
 
 
+@functools.lru_cache(maxsize=None)
+def _bug_report() -> str:
+    """Return the wrapped bug reporting message.
+
+    The message is wrapped only once for the width of the terminal, the
+    width falls back to the ``COLUMNS`` environment variable or to 80
+    columns if the output is not a terminal.
+
+    """
+
+    width = shutil.get_terminal_size().columns
+    title = "YIKES! There's a bug!".center(width, "-")
+    title += (
+        "If you are seeing this, then there is something wrong with "
+        "Miroslava. Please report this issue here: 'https://github.com/"
+        "kaamiki/miroslava/issues/new' so that we can fix it at the "
+        "earliest. It would be a great help if you provide the steps, "
+        "traceback information or even a code sample for reproducing this "
+        "bug while submitting an issue."
+    )
+    return textwrap.fill(title, width)
+
+
 class MiroslavaError(Exception):
     """Base exception class for all exceptions raised by Miroslava.
 
@@ -36,7 +60,7 @@ class MiroslavaError(Exception):
     def __str__(self) -> str:
         """Return formatted string with valid arguments."""
 
-        return self.msg.format(**vars(self))
+        return self.msg.format_map(vars(self))
 
     def report_bug(self) -> str:
         """Return bug reporting warning message.
@@ -45,14 +69,4 @@ class MiroslavaError(Exception):
 
         """
 
-        width = os.get_terminal_size().columns
-        title = "YIKES! There's a bug!".center(width, "-")
-        title += (
-            "If you are seeing this, then there is something wrong with "
-            "Miroslava. Please report this issue here: 'https://github.com/"
-            "kaamiki/miroslava/issues/new' so that we can fix it at the "
-            "earliest. It would be a great help if you provide the steps, "
-            "traceback information or even a code sample for reproducing this "
-            "bug while submitting an issue."
-        )
-        return textwrap.fill(title, width)
+        return _bug_report()
@@ -1,19 +1,26 @@
 """Logging: Control and capture logs."""
 
+import functools
 import logging
-import logging.handlers
 import os
 import sys
-from datetime import timedelta
 from types import TracebackType
 from typing import IO
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import List
+from typing import Mapping
 from typing import MutableMapping
 from typing import Optional
 from typing import Tuple
+from typing import Type
 from typing import Union
 
-from _miroslava.utils.common import TTYPalette
+from _miroslava import palette
+from _miroslava.utils.common import _ensure_ansi
+
+if TYPE_CHECKING:
+    from datetime import timedelta
 
 __all__ = [
     "FileHandler",
@@ -26,28 +33,55 @@ __all__ = [
     "TimedRotatingFileHandler",
     "create_logger",
     "get_logger",
-    "stderr",
-    "stdout",
 ]
 
+# NOTE: The module level ``stderr`` and ``stdout`` handlers are created
+# lazily on first access, see ``__getattr__``. They are kept out of
+# ``__all__`` as star imports would otherwise create them eagerly.
+
 SysExcInfoType = Tuple[type, BaseException, Optional[TracebackType]]
 TupleOfNone = Tuple[None, ...]
-
-logging._levelToName = {
-    60: "TRACE",
-    50: "FATAL",
-    40: "ERROR",
-    30: "WARN",
-    20: "INFO",
-    10: "DEBUG",
-    0: "NOTSET",
-}
-
-BASIC_FORMAT = (
+FormatterType = Union[logging.Formatter, Type[logging.Formatter]]
+
+if not getattr(logging, "_miroslava_levels_installed", False):
+    for level, name in (
+        (60, "TRACE"),
+        (50, "FATAL"),
+        (40, "ERROR"),
+        (30, "WARN"),
+        (20, "INFO"),
+        (10, "DEBUG"),
+    ):
+        logging.addLevelName(level, sys.intern(name))
+    del level, name
+    logging._miroslava_levels_installed = True  # type: ignore[attr-defined]
+
+BASIC_FORMAT = sys.intern(
     "%(asctime)s %(color)s%(levelname)s%(reset)s [%(threadName)s] "
     "%(caller)s:%(lineno)d : %(message)s"
 )
-EVENT_FORMAT = "%b %d, %y %H:%M:%S"
+EVENT_FORMAT = sys.intern("%b %d, %y %H:%M:%S")
+LOGGING_KWARGS = {"exc_info", "stack_info", "stacklevel"}
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_path(path: str, func: str, cwd: str) -> str:
+    """Return the formatted path, see :py:meth:`Formatter.format_path`.
+
+    The pathnames and callables repeat heavily across the logged events
+    so the result is cached on the arguments.
+
+    """
+
+    if path == "<stdin>":
+        return "shell"
+    sep = "site-packages" if "site-packages" in path else cwd
+    path = path.split(sep)[-1].replace(os.path.sep, ".")[:-3]
+    if path.startswith("."):
+        path = path[1:]
+    if func != "<module>":
+        path += f".{func}"
+    return path
 
 
 class Formatter(logging.Formatter):
@@ -64,11 +98,25 @@ class Formatter(logging.Formatter):
     :var level_style: Dictionary of log levels and associated colors.
     :var reset_style: Color code which resets all styling on TTY.
     :var use_default: Whether to use default format for logging.
+    :var cwd: Working directory used for formatting the paths. It is
+        captured once when the formatter is created, reassign it if the
+        process changes its working directory.
 
     .. note::
 
         Coloring of the logs currently depends upon the logging level.
 
+    .. tip::
+
+        Pass the arguments to the logging call instead of formatting
+        the message beforehand, i.e. ``logger.info("x=%s", x)`` rather
+        than ``logger.info(f"x={x}")``. The message is then merged with
+        its arguments only if the record is actually emitted and only
+        once across all the handlers. See `optimization`_ in the
+        logging HOWTO.
+
+    .. _optimization: https://docs.python.org/3/howto/logging.html#optimization
+
     .. seealso::
 
         :py:meth:`logging.Formatter.format()` and
@@ -87,15 +135,15 @@ class Formatter(logging.Formatter):
     """
 
     level_style = {
-        60: TTYPalette.DARK_VIOLET,  # type: ignore[attr-defined]
-        50: TTYPalette.RED_1,  # type: ignore[attr-defined]
-        40: TTYPalette.ORANGE_RED_1,  # type: ignore[attr-defined]
-        30: TTYPalette.YELLOW_3,  # type: ignore[attr-defined]
-        20: TTYPalette.GREEN_3,  # type: ignore[attr-defined]
-        10: TTYPalette.GREY_50,  # type: ignore[attr-defined]
-        0: TTYPalette.AQUA,  # type: ignore[attr-defined]
+        60: palette.TTY_COLOR_DARK_VIOLET,
+        50: palette.TTY_COLOR_RED_1,
+        40: palette.TTY_COLOR_ORANGE_RED_1,
+        30: palette.TTY_COLOR_YELLOW_3,
+        20: palette.TTY_COLOR_GREEN_3,
+        10: palette.TTY_COLOR_GREY_50,
+        0: palette.TTY_COLOR_AQUA,
     }
-    reset_style = TTYPalette.DEFAULT  # type: ignore[attr-defined]
+    reset_style = palette.TTY_STYLE_DEFAULT
     use_default = False
 
     def __init__(
@@ -112,6 +160,15 @@ class Formatter(logging.Formatter):
             datefmt = EVENT_FORMAT
         self.fmt = fmt
         self.datefmt = datefmt
+        self.cwd = os.getcwd()
+        self._tty_styles = {
+            level: (sys.intern(color), sys.intern(self.reset_style))
+            for level, color in self.level_style.items()
+        }
+        self._notty = ("", "")
+        self._has_caller = self.use_default or "%(caller)" in self.fmt
+        self._has_color = "%(color)" in self.fmt or "%(reset)" in self.fmt
+        self._delegate = logging.Formatter(self.fmt, self.datefmt)
 
     def colorize(self, record: logging.LogRecord) -> None:
         """Add colors to the logging levels by manipulating record.
@@ -125,10 +182,11 @@ class Formatter(logging.Formatter):
         """
 
         if getattr(record, "isatty", False):
-            record.color = self.level_style[record.levelno]  # type: ignore
-            record.reset = self.reset_style  # type: ignore
+            record.color, record.reset = self._tty_styles.get(  # type: ignore
+                record.levelno, self._notty
+            )
         else:
-            record.color = record.reset = ""  # type: ignore
+            record.color, record.reset = self._notty  # type: ignore
 
     def decolorize(self, record: logging.LogRecord) -> None:
         """Remove ``color`` and ``reset`` attributes from a record.
@@ -181,15 +239,7 @@ class Formatter(logging.Formatter):
 
         """
 
-        if path == "<stdin>":
-            return "shell"
-        sep = "site-packages" if "site-packages" in path else os.getcwd()
-        path = path.split(sep)[-1].replace(os.path.sep, ".")[
-            path[0] != "." : -3
-        ]
-        if func != "<module>":
-            path += f".{func}"
-        return path
+        return _format_path(path, func, self.cwd)
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as text.
@@ -203,7 +253,7 @@ class Formatter(logging.Formatter):
 
         """
 
-        if self.use_default or "caller" in self.fmt:
+        if self._has_caller:
             if record.funcName == "<lambda>":
                 record.funcName = "lambda"
             record.caller = self.format_path(  # type: ignore[attr-defined]
@@ -211,11 +261,11 @@ class Formatter(logging.Formatter):
             )
         if record.exc_info:
             record.msg = self.formatException(record.exc_info)
+            record.args = ()
             record.exc_info = record.exc_text = None
-        self.colorize(record)
-        text = logging.Formatter(self.fmt, self.datefmt).format(record)
-        self.decolorize(record)
-        return text
+        if self._has_color:
+            self.colorize(record)
+        return self._delegate.format(record)
 
 
 class Handler(object):
@@ -228,7 +278,7 @@ class Handler(object):
     :param handler: Handler instance which will output to a stream.
     :param level: Logging level of the logged event, defaults to None.
     :param formatter: Formatter instance to use for formatting record,
-        defaults to :py:class:`Formatter`.
+        defaults to a new :py:class:`Formatter`.
 
     .. versionadded:: 1.1.0
 
@@ -238,10 +288,14 @@ class Handler(object):
         self,
         handler: logging.Handler,
         level: Optional[Union[int, str]] = None,
-        formatter: logging.Formatter = Formatter,  # type: ignore[assignment]
+        formatter: Optional[FormatterType] = None,
     ) -> None:
         """Initialize the handler."""
 
+        if formatter is None:
+            formatter = Formatter()
+        elif isinstance(formatter, type):
+            formatter = formatter()
         self.handler = handler
         self.handler.setFormatter(formatter)
         if level:
@@ -267,7 +321,7 @@ class FileHandler(Handler):
         to None.
     :param level: Logging level of the logged event, defaults to None.
     :param formatter: Formatter instance to use for formatting record,
-        defaults to :py:class:`Formatter`.
+        defaults to a new :py:class:`Formatter`.
 
     .. seealso::
 
@@ -284,7 +338,7 @@ class FileHandler(Handler):
         mode: str = "a",
         encoding: Optional[str] = None,
         level: Optional[Union[int, str]] = None,
-        formatter: logging.Formatter = Formatter,  # type: ignore[assignment]
+        formatter: Optional[FormatterType] = None,
     ) -> None:
         """Open the file and use it as the stream for logging."""
 
@@ -310,7 +364,7 @@ class RotatingFileHandler(Handler):
         to None.
     :param level: Logging level of the logged event, defaults to None.
     :param formatter: Formatter instance to use for formatting record,
-        defaults to :py:class:`Formatter`.
+        defaults to a new :py:class:`Formatter`.
 
     .. note::
 
@@ -344,13 +398,13 @@ class RotatingFileHandler(Handler):
         backups: int = 5,
         encoding: Optional[str] = None,
         level: Optional[Union[int, str]] = None,
-        formatter: logging.Formatter = Formatter,  # type: ignore[assignment]
+        formatter: Optional[FormatterType] = None,
     ) -> None:
         """Open the file and use it as the stream for logging."""
 
-        handler = logging.handlers.RotatingFileHandler(
-            filename, mode, max_bytes, backups, encoding
-        )
+        from logging.handlers import RotatingFileHandler as _RFH
+
+        handler = _RFH(filename, mode, max_bytes, backups, encoding)
         super().__init__(handler, level, formatter)
 
     def do_rollover(self) -> Any:
@@ -373,7 +427,7 @@ class TimedRotatingFileHandler(Handler):
         to None.
     :param level: Logging level of the logged event, defaults to None.
     :param formatter: Formatter instance to use for formatting record,
-        defaults to :py:class:`Formatter`.
+        defaults to a new :py:class:`Formatter`.
 
     .. note::
 
@@ -393,15 +447,17 @@ class TimedRotatingFileHandler(Handler):
         self,
         filename: str,
         when: str = "S",
-        interval: Union[int, float, timedelta] = timedelta(days=1),
+        interval: Union[int, float, "timedelta"] = 86400,
         backups: int = 5,
         encoding: Optional[str] = None,
         level: Optional[Union[int, str]] = None,
-        formatter: logging.Formatter = Formatter,  # type: ignore[assignment]
+        formatter: Optional[FormatterType] = None,
     ) -> None:
         """Open the file and use it as the stream for logging."""
 
-        handler = logging.handlers.TimedRotatingFileHandler(
+        from logging.handlers import TimedRotatingFileHandler as _TRFH
+
+        handler = _TRFH(
             filename, when, self.to_seconds(interval), backups, encoding
         )
         super().__init__(handler, level, formatter)
@@ -417,7 +473,7 @@ class TimedRotatingFileHandler(Handler):
         return self.handler.doRollover()  # type: ignore
 
     @staticmethod
-    def to_seconds(interval: Union[int, float, timedelta]) -> int:
+    def to_seconds(interval: Union[int, float, "timedelta"]) -> int:
         """Convert the time delta into seconds.
 
         :param interval: Interval timestamp to convert.
@@ -426,7 +482,7 @@ class TimedRotatingFileHandler(Handler):
         """
 
         if isinstance(interval, (int, float)):
-            interval = timedelta(seconds=interval)
+            return int(interval)
         return int(interval.total_seconds())
 
 
@@ -434,6 +490,18 @@ class StreamHandlerHinter(logging.StreamHandler):
     """StreamHandler instance which hints if the output stream is a
     TTY.
 
+    :param stream: IO stream, defaults to sys.stderr.
+    :param capacity: Number of records to buffer before writing them to
+        the stream at once, defaults to 0 i.e. no buffering.
+    :param force_color: Boolean flag to colorize the records even if the
+        stream is not a TTY, defaults to False.
+
+    .. note::
+
+        The buffered records are written as soon as the buffer is full,
+        a record with ``WARNING`` or higher severity is emitted or the
+        handler is flushed or closed.
+
     .. seealso::
 
         :py:meth:`logging.StreamHandler.format` from the python standard
@@ -443,25 +511,99 @@ class StreamHandlerHinter(logging.StreamHandler):
 
     """
 
+    _isatty: Optional[bool] = None
+
+    def __init__(
+        self,
+        stream: Optional[IO[str]] = None,
+        capacity: int = 0,
+        force_color: bool = False,
+    ) -> None:
+        """Initialize the handler."""
+
+        super().__init__(stream)
+        self.capacity = capacity
+        self.force_color = force_color
+        self.buffer: List[str] = []
+
+    def setStream(self, stream: IO[str]) -> Optional[IO[str]]:
+        """Set the stream and reset the cached TTY hint.
+
+        :param stream: IO stream to use for the handler.
+        :return: Old stream if the stream was changed, else None.
+
+        """
+
+        self._isatty = None
+        return super().setStream(stream)
+
     def format(self, record: logging.LogRecord) -> str:
         """Add hint if the specified stream is a TTY.
 
+        The stream is probed only once as it cannot turn into a TTY
+        during the lifetime of the process. The probe is skipped if
+        ``force_color`` is set.
+
         :param record: Instance of the logged event.
         :return: Formatted string for the output stream.
 
         """
 
-        if hasattr(self.stream, "isatty"):
+        if self._isatty is None:
             try:
-                record.isatty = self.stream.isatty()  # type: ignore
-            except ValueError:
-                record.isatty = False  # type: ignore
-        else:
-            record.isatty = False  # type: ignore
+                self._isatty = self.force_color or bool(self.stream.isatty())
+            except (AttributeError, ValueError):
+                self._isatty = False
+            if self._isatty:
+                _ensure_ansi()
+        record.isatty = self._isatty  # type: ignore[attr-defined]
         strict = super().format(record)
         del record.isatty  # type: ignore
         return strict
 
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a record, buffering it if ``capacity`` is set.
+
+        :param record: Instance of the logged event.
+
+        """
+
+        if not self.capacity:
+            super().emit(record)
+            return
+        try:
+            self.buffer.append(self.format(record) + self.terminator)
+            if (
+                len(self.buffer) >= self.capacity
+                or record.levelno >= logging.WARNING
+            ):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write the buffered records in one go and flush the stream."""
+
+        self.acquire()
+        try:
+            if self.buffer:
+                self.stream.write("".join(self.buffer))
+                self.buffer.clear()
+            super().flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Write the buffered records and close the handler."""
+
+        try:
+            if self.buffer:
+                self.flush()
+        finally:
+            super().close()
+
 
 class StreamHandler(Handler):
     """Handler class which writes logging records, appropriately
@@ -470,7 +612,11 @@ class StreamHandler(Handler):
     :param stream: IO stream, defaults to sys.stderr.
     :param level: Logging level of the logged event, defaults to None.
     :param formatter: Formatter instance to use for formatting record,
-        defaults to :py:class:`Formatter`.
+        defaults to a new :py:class:`Formatter`.
+    :param capacity: Number of records to buffer before writing them to
+        the stream at once, defaults to 0 i.e. no buffering.
+    :param force_color: Boolean flag to colorize the records even if the
+        stream is not a TTY, defaults to False.
 
     .. note::
 
@@ -485,15 +631,34 @@ class StreamHandler(Handler):
         self,
         stream: Optional[IO[str]] = sys.stderr,
         level: Optional[Union[int, str]] = None,
-        formatter: logging.Formatter = Formatter,  # type: ignore[assignment]
+        formatter: Optional[FormatterType] = None,
+        capacity: int = 0,
+        force_color: bool = False,
     ) -> None:
         """Initialize the stream handler."""
 
-        super().__init__(StreamHandlerHinter(stream), level, formatter)
+        handler = StreamHandlerHinter(stream, capacity, force_color)
+        super().__init__(handler, level, formatter)
+
+
+def __getattr__(name: str) -> StreamHandler:
+    """Create the ``stderr`` and ``stdout`` handlers on first access."""
+
+    if name == "stderr":
+        handler = StreamHandler()
+    elif name == "stdout":
+        handler = StreamHandler(sys.stdout)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = handler
+    return handler
 
 
-stderr = StreamHandler()
-stdout = StreamHandler(sys.stdout)
+if sys.version_info < (3, 7):
+    # NOTE: Module level ``__getattr__`` (PEP 562) is supported only on
+    # Python 3.7 and above, older interpreters import the names eagerly.
+    stderr = __getattr__("stderr")
+    stdout = __getattr__("stdout")
 
 
 class Logger(logging.LoggerAdapter):
@@ -511,6 +676,21 @@ class Logger(logging.LoggerAdapter):
 
     """
 
+    def __init__(
+        self, logger: logging.Logger, extra: Optional[Mapping[str, Any]] = None
+    ) -> None:
+        """Initialize the logger adapter.
+
+        The level check and logging methods of the underlying logger are
+        bound once so that every logging call skips the attribute
+        lookups and returns early for the disabled levels.
+
+        """
+
+        super().__init__(logger, extra)
+        self._enabled = logger.isEnabledFor
+        self._log = logger._log  # type: ignore[method-assign]
+
     def process(
         self, msg: Any, kwargs: MutableMapping[str, Any]
     ) -> Tuple[Any, MutableMapping[str, Any]]:
@@ -527,48 +707,69 @@ class Logger(logging.LoggerAdapter):
 
         """
 
-        extra = self.extra.copy()  # type: ignore[attr-defined]
-        if "extra" in kwargs:
-            extra.update(kwargs.pop("extra"))  # type: ignore[attr-defined]
-        for name in kwargs.keys():
-            if name == "exc_info":
-                continue
-            extra[name] = kwargs.pop(name)
-        kwargs["extra"] = extra
+        extra = kwargs.pop("extra", None)
+        context = {
+            name: kwargs.pop(name)
+            for name in list(kwargs)
+            if name not in LOGGING_KWARGS
+        }
+        if extra or context:
+            merged = dict(self.extra or {})
+            if extra:
+                merged.update(extra)
+            merged.update(context)
+            kwargs["extra"] = merged
+        elif self.extra:
+            kwargs["extra"] = self.extra
         return msg, kwargs
 
     def debug(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log message with ``DEBUG`` severity level."""
 
-        self.logger._log(10, msg, args, **kwargs)
+        if self._enabled(10):
+            self._log(10, msg, args, **kwargs)
 
     def info(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log message with ``INFO`` severity level."""
 
-        self.logger._log(20, msg, args, **kwargs)
+        if self._enabled(20):
+            self._log(20, msg, args, **kwargs)
 
     def warning(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log message with ``WARNING`` severity level."""
 
-        self.logger._log(30, msg, args, **kwargs)
+        if self._enabled(30):
+            self._log(30, msg, args, **kwargs)
+
+    def warn(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+        """Log message with ``WARNING`` severity level."""
+
+        if self._enabled(30):
+            self._log(30, msg, args, **kwargs)
 
     def error(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log message with ``ERROR`` severity level."""
 
-        self.logger._log(40, msg, args, **kwargs)
+        if self._enabled(40):
+            self._log(40, msg, args, **kwargs)
 
     def critical(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log message with ``CRITICAL`` severity level."""
 
-        self.logger._log(50, msg, args, **kwargs)
+        if self._enabled(50):
+            self._log(50, msg, args, **kwargs)
 
-    def exception(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+    def fatal(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log message with ``CRITICAL`` severity level."""
 
-        self.logger._log(60, msg, args, True, **kwargs)
+        if self._enabled(50):
+            self._log(50, msg, args, **kwargs)
+
+    def exception(self, msg: Any, *args: Any, **kwargs: Any) -> None:
+        """Log message with ``CRITICAL`` severity level."""
 
-    fatal = critical
-    warn = warning
+        if self._enabled(60):
+            self._log(60, msg, args, exc_info=True, **kwargs)
 
 
 def get_logger(name: Optional[str] = None, **kwargs: Any) -> Logger:
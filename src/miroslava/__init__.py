@@ -1,26 +1,35 @@
 """Miroslava: A simple sandbox environment."""
 
+import importlib
+import sys
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import List
+
 try:
     from ._about import __version__
 except ImportError:
     __version__ = "0.0.0"
 
-from _miroslava import palette
-from _miroslava.utils import FileHandler
-from _miroslava.utils import Formatter
-from _miroslava.utils import Handler
-from _miroslava.utils import Logger
-from _miroslava.utils import MiroslavaError
-from _miroslava.utils import RotatingFileHandler
-from _miroslava.utils import SingletonMeta
-from _miroslava.utils import StreamHandler
-from _miroslava.utils import StreamHandlerHinter
-from _miroslava.utils import TimedRotatingFileHandler
-from _miroslava.utils import TTYPalette
-from _miroslava.utils import create_logger
-from _miroslava.utils import get_logger
-from _miroslava.utils import stderr
-from _miroslava.utils import stdout
+import _miroslava
+
+if TYPE_CHECKING:
+    from _miroslava import palette
+    from _miroslava.utils import FileHandler
+    from _miroslava.utils import Formatter
+    from _miroslava.utils import Handler
+    from _miroslava.utils import Logger
+    from _miroslava.utils import MiroslavaError
+    from _miroslava.utils import RotatingFileHandler
+    from _miroslava.utils import SingletonMeta
+    from _miroslava.utils import StreamHandler
+    from _miroslava.utils import StreamHandlerHinter
+    from _miroslava.utils import TimedRotatingFileHandler
+    from _miroslava.utils import TTYPalette
+    from _miroslava.utils import create_logger
+    from _miroslava.utils import get_logger
+    from _miroslava.utils.logging import stderr
+    from _miroslava.utils.logging import stdout
 
 __all__ = [
     "palette",
@@ -40,3 +49,33 @@ __all__ = [
     "stderr",
     "stdout",
 ]
+
+# NOTE: The public names are imported lazily on first access (PEP 562)
+# so that ``import miroslava`` does not pull in the logging machinery
+# unless it is actually used. The names are resolved by ``_miroslava``.
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public names on first access."""
+
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name == "palette":
+        value = importlib.import_module("_miroslava.palette")
+    else:
+        value = getattr(_miroslava, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Return the module attributes along with the lazy public names."""
+
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # NOTE: Module level ``__getattr__`` (PEP 562) is supported only on
+    # Python 3.7 and above, older interpreters import the names eagerly.
+    for _name in __all__:
+        __getattr__(_name)
@@ -1,4 +1,11 @@
+import io
+import os
+import sys
+from typing import Any
+
+import miroslava
 import pytest
+from _miroslava.utils import common
 from miroslava import SingletonMeta
 from miroslava import TTYPalette
 
@@ -24,3 +31,25 @@ def test_singleton() -> None:
 )
 def test_ttypalette(color: str, expected: str) -> None:
     assert getattr(TTYPalette, color) == expected
+
+
+def test_dir_lists_version_and_lazy_names() -> None:
+    names = dir(miroslava)
+    assert "__version__" in names
+    assert "TTYPalette" in names
+
+
+@pytest.mark.parametrize("isatty", (False, True))
+def test_ttypalette_enables_ansi_only_on_tty(
+    isatty: bool, monkeypatch: Any
+) -> None:
+    calls = []
+    stdout = io.StringIO()
+    monkeypatch.setattr(stdout, "isatty", lambda: isatty)
+    monkeypatch.setattr(sys, "stdout", stdout)
+    monkeypatch.setattr(os, "name", "nt")
+    monkeypatch.setattr(os, "system", calls.append)
+    monkeypatch.setattr(common, "_ansi_enabled", False)
+    monkeypatch.delattr(TTYPalette, "PLUM_2", raising=False)
+    assert TTYPalette.PLUM_2 == "\u001b[38;5;183m"
+    assert calls == (["color"] if isatty else [])
@@ -0,0 +1,23 @@
+from miroslava import MiroslavaError
+
+
+class ConnectionFailedError(MiroslavaError):
+    msg = "Cannot connect to {host}:{port} ({host!r})"
+
+
+class PaddedValueError(MiroslavaError):
+    msg = "value {value:>{width}}"
+
+
+def test_miroslava_error_message() -> None:
+    error = ConnectionFailedError(host="127.0.0.1", port=6969)
+    assert str(error) == "Cannot connect to 127.0.0.1:6969 ('127.0.0.1')"
+
+
+def test_miroslava_error_nested_format_spec() -> None:
+    assert str(PaddedValueError(value=1, width=3)) == "value   1"
+
+
+def test_miroslava_error_message_override() -> None:
+    error = ConnectionFailedError(msg="custom {x}", x=1)
+    assert str(error) == "custom 1"
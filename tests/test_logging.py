@@ -1,7 +1,15 @@
+import io
+import logging
+import logging.handlers
+import pickle
+import queue
+import threading
 from typing import Any
 
 import pytest
+from miroslava import Formatter
 from miroslava import Logger
+from miroslava import StreamHandler
 from miroslava import create_logger
 
 
@@ -13,7 +21,7 @@ def dummy_log_function(
 
 default_formatter_expected_msg = (
     "{} [MainThread] tests.test_logging."
-    "dummy_log_function:11 : Test {} message with default formatter\n"
+    "dummy_log_function:14 : Test {} message with default formatter\n"
 )
 
 
@@ -127,3 +135,92 @@ def test_with_extra_args(
     dummy_log_function(logger, msg, level, addr="127.0.0.1", port=6969)
     _, stderr = capsys.readouterr()
     assert stderr == expected
+
+
+def test_process_with_contextual_kwargs(capsys: Any) -> None:
+    logger = create_logger(format="%(addr)s:%(port)s - %(message)s")
+    logger.log(20, "Test message with contextual kwargs", addr="::1", port=80)
+    _, stderr = capsys.readouterr()
+    assert stderr == "::1:80 - Test message with contextual kwargs\n"
+
+
+@pytest.mark.parametrize("formatter", (None, Formatter))
+def test_handler_with_default_formatter(formatter: Any) -> None:
+    handler = StreamHandler(formatter=formatter)
+    assert isinstance(handler.handler.formatter, Formatter)
+
+
+def test_exception_with_args(capsys: Any) -> None:
+    logger = create_logger(format="%(levelname)s:%(message)s")
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("Test exception message with %s", "args")
+    _, stderr = capsys.readouterr()
+    assert stderr.startswith(
+        "TRACE:ZeroDivisionError: division by zero in "
+        "test_exception_with_args() on line"
+    )
+
+
+def test_formatter_reuses_delegate() -> None:
+    formatter = Formatter("%(levelname)s:%(message)s")
+    delegate = formatter._delegate
+    record = logging.LogRecord("root", 20, __file__, 1, "Test", None, None)
+    for _ in range(1000):
+        assert formatter.format(record) == "INFO:Test"
+    assert formatter._delegate is delegate
+
+
+def test_handler_with_capacity() -> None:
+    stream = io.StringIO()
+    handler = StreamHandler(
+        stream, formatter=Formatter("%(message)s"), capacity=2
+    )
+    record = logging.LogRecord("root", 20, __file__, 1, "Test", None, None)
+    handler.handler.handle(record)
+    assert stream.getvalue() == ""
+    handler.handler.handle(record)
+    assert stream.getvalue() == "Test\nTest\n"
+
+
+@pytest.mark.parametrize("force_color", (False, True))
+def test_handler_with_force_color(force_color: bool) -> None:
+    stream = io.StringIO()
+    formatter = Formatter("%(color)s%(message)s%(reset)s")
+    handler = StreamHandler(
+        stream, formatter=formatter, force_color=force_color
+    )
+    record = logging.LogRecord("root", 20, __file__, 1, "Test", None, None)
+    handler.handler.handle(record)
+    assert ("\x1b" in stream.getvalue()) is force_color
+
+
+def test_prepared_record_can_be_pickled() -> None:
+    handler = logging.handlers.QueueHandler(queue.Queue())
+    handler.setFormatter(Formatter("%(message)s"))
+    args = (threading.Lock(),)
+    record = logging.LogRecord("root", 20, __file__, 1, "held %s", args, None)
+    prepared = handler.prepare(record)
+    assert pickle.loads(pickle.dumps(prepared)).getMessage() == prepared.msg
+
+
+def test_handler_filter_rewrites_message() -> None:
+    def redact(record: logging.LogRecord) -> bool:
+        record.msg = record.msg.replace("hunter2", "***")
+        return True
+
+    plain, redacted = io.StringIO(), io.StringIO()
+    formatter = Formatter("%(message)s")
+    handlers = [
+        StreamHandler(plain, formatter=formatter).handler,
+        StreamHandler(redacted, formatter=formatter).handler,
+    ]
+    handlers[1].addFilter(redact)
+    record = logging.LogRecord(
+        "root", 20, __file__, 1, "password is hunter2", None, None
+    )
+    for handler in handlers:
+        handler.handle(record)
+    assert plain.getvalue() == "password is hunter2\n"
+    assert redacted.getvalue() == "password is ***\n"